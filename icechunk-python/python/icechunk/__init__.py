@@ -350,6 +350,30 @@ class IcechunkStore(Store, SyncMixin):
         """
         return await self._store.async_merge(changes)
 
+    def merge_many(self, changes: Iterable[bytes]) -> None:
+        """Merge the changes from several other stores into this store.
+
+        This is equivalent to calling `merge` once for each element of `changes`,
+        in order, but crosses into the Rust library and takes the store lock only once.
+
+        The behavior is undefined if the stores applied conflicting changes.
+        """
+        return self._store.merge_many(
+            changes if isinstance(changes, list) else list(changes)
+        )
+
+    async def async_merge_many(self, changes: Iterable[bytes]) -> None:
+        """Merge the changes from several other stores into this store.
+
+        This is equivalent to calling `async_merge` once for each element of `changes`,
+        in order, but crosses into the Rust library and takes the store lock only once.
+
+        The behavior is undefined if the stores applied conflicting changes.
+        """
+        return await self._store.async_merge_many(
+            changes if isinstance(changes, list) else list(changes)
+        )
+
     @property
     def has_uncommitted_changes(self) -> bool:
         """Return True if there are uncommitted changes to the store"""
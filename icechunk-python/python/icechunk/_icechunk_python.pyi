@@ -26,6 +26,8 @@ class PyIcechunkStore:
     async def async_reset(self) -> bytes: ...
     def merge(self, changes: bytes) -> None: ...
     async def async_merge(self, changes: bytes) -> None: ...
+    def merge_many(self, changes: list[bytes]) -> None: ...
+    async def async_merge_many(self, changes: list[bytes]) -> None: ...
     def new_branch(self, branch_name: str) -> str: ...
     async def async_new_branch(self, branch_name: str) -> str: ...
     def reset_branch(self, snapshot_id: str) -> None: ...
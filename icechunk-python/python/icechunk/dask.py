@@ -24,6 +24,9 @@ from icechunk.distributed import extract_store, merge_stores
 
 SimpleGraph: TypeAlias = Mapping[tuple[str, int], tuple[Any, ...]]
 
+# `dask.array.store` arguments that `store_dask` sets itself
+_STORE_ONLY_KWARGS = ("compute", "return_stored", "load_stored", "lock")
+
 
 def _assert_correct_dask_version() -> None:
     if Version(dask.__version__) < Version("2024.11.0"):
@@ -62,18 +65,27 @@ def store_dask(
         Number of changesets to merge at a given time.
     **store_kwargs:
         Arbitrary keyword arguments passed to `dask.array.store`. Notably `compute`,
-        `return_stored`, `load_stored`, and `lock` are unsupported.
+        `return_stored`, `load_stored`, and `lock` are ignored.
     """
     stored_arrays = dask.array.store(  # type: ignore[attr-defined]
         sources=sources,
         targets=targets,  # type: ignore[arg-type]
         regions=regions,
-        compute=False,
-        return_stored=True,
-        load_stored=False,
-        lock=False,
-        **store_kwargs,
+        **{
+            **store_kwargs,
+            "compute": False,
+            # each returned chunk is the Zarr array written by that task,
+            # whose store holds the changes we need to merge
+            "return_stored": True,
+            "load_stored": False,
+            "lock": False,
+        },
     )
+    # the remaining kwargs (e.g. `scheduler`) are meant for computing the graph
+    compute_kwargs = {
+        k: v for k, v in store_kwargs.items() if k not in _STORE_ONLY_KWARGS
+    }
+
     # Now we tree-reduce all changesets
     merged_store = stateful_store_reduce(
         stored_arrays,
@@ -82,9 +94,12 @@ def store_dask(
         aggregate=merge_stores,
         split_every=split_every,
         compute=True,
-        **store_kwargs,
+        **compute_kwargs,
     )
-    store.merge(merged_store.change_set_bytes())
+    # Without serialization (e.g. the threaded scheduler), every task writes to
+    # `store` itself, so the reduction returns it and there is nothing to merge.
+    if merged_store is not store:
+        store.merge(merged_store.change_set_bytes())
 
 
 # tree-reduce all changesets, regardless of array
@@ -10,7 +10,8 @@ def extract_store(zarray: zarr.Array) -> IcechunkStore:
 
 
 def merge_stores(*stores: IcechunkStore) -> IcechunkStore:
-    store, *rest = stores
-    for other in rest:
-        store.merge(other.change_set_bytes())
+    it = iter(stores)
+    store = next(it)
+    # a store shared by several tasks already holds its own changes
+    store.merge_many([other.change_set_bytes() for other in it if other is not store])
     return store
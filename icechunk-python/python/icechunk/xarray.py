@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
-import importlib
+import math
 from collections.abc import Hashable, Mapping, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -10,10 +11,10 @@ from packaging.version import Version
 import xarray as xr
 import zarr
 from icechunk import IcechunkStore
-from icechunk.dask import stateful_store_reduce
-from icechunk.distributed import extract_store, merge_stores
+from icechunk.dask import store_dask
 from icechunk.vendor.xarray import _choose_default_mode
 from xarray import Dataset
+from xarray.backends.api import _validate_dataset_names, dump_to_store
 from xarray.backends.common import ArrayWriter
 from xarray.backends.zarr import ZarrStore
 
@@ -21,8 +22,17 @@ Region = Mapping[str, slice | Literal["auto"]] | Literal["auto"] | None
 ZarrWriteModes = Literal["w", "w-", "a", "a-", "r+", "r"]
 
 
+# writes with at most this many dask chunks merge all changesets in one task
+_SINGLE_MERGE_MAX_CHUNKS = 32
+
+# pre-built whole-array selections, so that writes skip normalizing an Ellipsis
+_FULL_SELECT = {n: (slice(None),) * n for n in range(8)}
+
+
 try:
-    has_dask = importlib.util.find_spec("dask") is not None
+    from dask.base import is_dask_collection
+
+    has_dask = True
 except ImportError:
     has_dask = False
 
@@ -34,20 +44,47 @@ if Version(xr.__version__) < Version("2024.10.0"):
 
 def is_chunked_array(x: Any) -> bool:
     if has_dask:
-        import dask
-
-        return dask.base.is_dask_collection(x)
+        return is_dask_collection(x)
     else:
         return False
 
 
+def _full_selection(ndim: int) -> tuple[slice, ...]:
+    try:
+        return _FULL_SELECT[ndim]
+    except KeyError:
+        return (slice(None),) * ndim
+
+
+def _is_all_fill_value(data: np.ndarray[Any, Any], fill_value: Any) -> bool:
+    if data.size == 0:
+        return True
+    if data.dtype.kind not in "biufc":
+        return False
+    if data.dtype.kind in "fc" and np.isnan(fill_value):
+        return bool(np.all(np.isnan(data)))
+    return bool(np.all(data == fill_value))
+
+
+def _default_split_every(n_chunks: int) -> int:
+    if n_chunks <= _SINGLE_MERGE_MAX_CHUNKS:
+        # Few enough changesets to merge them all in a single task,
+        # without building intermediate layers of the reduction tree.
+        return n_chunks
+    # Merging ceil(sqrt(n)) changesets per task gives exactly two levels of merges,
+    # up to the cap of 64 per task (4096 chunks).
+    return min(64, math.ceil(math.sqrt(n_chunks)))
+
+
 class LazyArrayWriter(ArrayWriter):
-    def __init__(self) -> None:
+    def __init__(self, *, skip_fill_value_writes: bool = False) -> None:
         super().__init__()  # type: ignore[no-untyped-call]
 
-        self.eager_sources: list[np.ndarray[Any, Any]] = []
-        self.eager_targets: list[zarr.Array] = []
-        self.eager_regions: list[tuple[slice, ...]] = []
+        # Only safe when every target array was freshly created by this write,
+        # otherwise skipping would leave stale chunks behind.
+        self.skip_fill_value_writes = skip_fill_value_writes
+
+        self._eager: list[tuple[np.ndarray[Any, Any], zarr.Array, tuple[slice, ...]]] = []
 
     def add(self, source: Any, target: Any, region: Any = None) -> Any:
         if is_chunked_array(source):
@@ -55,18 +92,45 @@ class LazyArrayWriter(ArrayWriter):
             self.targets.append(target)
             self.regions.append(region)
         else:
-            self.eager_sources.append(source)
-            self.eager_targets.append(target)
-            self.eager_regions.append(region)
-
-    def write_eager(self) -> None:
-        for source, target, region in zip(
-            self.eager_sources, self.eager_targets, self.eager_regions, strict=True
-        ):
-            target[region or ...] = source
-        self.eager_sources = []
-        self.eager_targets = []
-        self.eager_regions = []
+            self._eager.append((source, target, region))
+
+    def _write(self, source: Any, target: zarr.Array, region: Any) -> None:
+        if self.skip_fill_value_writes:
+            write_empty_chunks = getattr(target, "write_empty_chunks", None)
+            if write_empty_chunks is None:
+                write_empty_chunks = zarr.config.get("array.write_empty_chunks", False)
+            fill_value = getattr(target, "fill_value", None)
+            if not write_empty_chunks and fill_value is not None:
+                source = np.asarray(source)
+                if _is_all_fill_value(source, fill_value):
+                    # Zarr would not write any of these chunks anyway,
+                    # so skip encoding them altogether.
+                    return
+        target[region or _full_selection(target.ndim)] = source
+
+    def write_eager(self, max_workers: int | None = None) -> None:
+        if len(self._eager) <= 1:
+            # not worth spinning up a thread pool for a single variable
+            for source, target, region in self._eager:
+                self._write(source, target, region)
+        else:
+            # Each write is dominated by compression and store I/O, both of which
+            # release the GIL, so fan the variables out across threads.
+            if max_workers is None:
+                max_workers = min(32, len(self._eager))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._write, source, target, region)
+                    for source, target, region in self._eager
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    # don't start the writes still queued behind the failed one
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        self._eager.clear()
 
 
 @dataclass
@@ -87,6 +151,8 @@ class XarrayDatasetWriter:
     _initialized: bool = field(default=False, repr=False)
 
     xarray_store: ZarrStore = field(init=False, repr=False)
+    mode: ZarrWriteModes = field(init=False, repr=False)
+    group: str | None = field(init=False, repr=False)
     writer: LazyArrayWriter = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
@@ -106,6 +172,8 @@ class XarrayDatasetWriter:
         concrete_mode: ZarrWriteModes = _choose_default_mode(
             mode=mode, append_dim=append_dim, region=region
         )
+        self.mode = concrete_mode
+        self.group = group
 
         self.xarray_store = ZarrStore.open_group(
             store=self.store,
@@ -128,8 +196,6 @@ class XarrayDatasetWriter:
         This method creates new Zarr arrays when necessary, writes attributes,
         and any in-memory arrays.
         """
-        from xarray.backends.api import _validate_dataset_names, dump_to_store
-
         # validate Dataset keys, DataArray names
         _validate_dataset_names(self.dataset)
 
@@ -137,24 +203,36 @@ class XarrayDatasetWriter:
             encoding = {}
         self.xarray_store._validate_encoding(encoding)
 
+        # validates `region`, resolves any "auto" dimensions from the existing
+        # indexes, and drops the indexes, which region writes must not overwrite
+        dataset = self.xarray_store._validate_and_autodetect_region(self.dataset)
+
         # This writes the metadata (zarr.json) for all arrays
         # This also will resize arrays for any appends
-        self.writer = LazyArrayWriter()
-        dump_to_store(self.dataset, self.xarray_store, self.writer, encoding=encoding)  # type: ignore[no-untyped-call]
+        # With "w" and "w-" every array is created from scratch, so there are no
+        # existing chunks that an all-fill-value write would need to clear.
+        self.writer = LazyArrayWriter(skip_fill_value_writes=self.mode in ("w", "w-"))
+        dump_to_store(dataset, self.xarray_store, self.writer, encoding=encoding)  # type: ignore[no-untyped-call]
 
         self._initialized = True
 
-    def write_eager(self) -> None:
+    def write_eager(self, max_workers: int | None = None) -> None:
         """
         Write in-memory variables to store.
 
+        Parameters
+        ----------
+        max_workers: int, optional
+            Maximum number of threads used to write variables concurrently.
+            Defaults to one thread per variable, capped at 32.
+
         Returns
         -------
         None
         """
         if not self._initialized:
             raise ValueError("Please call `write_metadata` first.")
-        self.writer.write_eager()
+        self.writer.write_eager(max_workers=max_workers)
 
     def write_lazy(
         self,
@@ -170,27 +248,25 @@ class XarrayDatasetWriter:
         if not self.writer.sources:
             return
 
-        chunkmanager_store_kwargs = chunkmanager_store_kwargs or {}
-        chunkmanager_store_kwargs["load_stored"] = False
-        chunkmanager_store_kwargs["return_stored"] = True
-
-        # This calls dask.array.store, and we receive a dask array where each chunk is a Zarr array
-        # each of those zarr.Array.store contains the changesets we need
-        stored_arrays = self.writer.sync(
-            compute=False, chunkmanager_store_kwargs=chunkmanager_store_kwargs
-        )  # type: ignore[no-untyped-call]
-
-        # Now we tree-reduce all changesets
-        merged_store = stateful_store_reduce(
-            stored_arrays,
-            prefix="ice-changeset",
-            chunk=extract_store,
-            aggregate=merge_stores,
+        if split_every is None:
+            # each chunk of the sources is written by its own task
+            split_every = _default_split_every(
+                sum(source.npartitions for source in self.writer.sources)
+            )
+
+        # This eagerly writes all dask arrays in a single graph,
+        # then tree-reduces the changesets of the write tasks into `self.store`
+        store_dask(
+            self.store,
+            sources=self.writer.sources,
+            targets=self.writer.targets,
+            regions=self.writer.regions,
             split_every=split_every,
-            compute=True,
-            **chunkmanager_store_kwargs,
+            **(chunkmanager_store_kwargs or {}),
         )
-        self.store.merge(merged_store.change_set_bytes())
+        self.writer.sources = []
+        self.writer.targets = []
+        self.writer.regions = []
 
 
 def to_icechunk(
@@ -207,6 +283,7 @@ def to_icechunk(
     encoding: Mapping[Any, Any] | None = None,
     chunkmanager_store_kwargs: MutableMapping[Any, Any] | None = None,
     split_every: int | None = None,
+    max_workers: int | None = None,
     **kwargs: Any,
 ) -> None:
     """
@@ -273,6 +350,11 @@ def to_icechunk(
         `dask.array.store()`. Experimental API that should not be relied upon.
     split_every: int, optional
         Number of tasks to merge at every level of the tree reduction.
+        Defaults to merging everything at once for up to 32 write tasks, and to
+        the square root of the number of write tasks, at most 64, otherwise.
+    max_workers: int, optional
+        Maximum number of threads used to write in-memory variables concurrently.
+        Defaults to one thread per variable, capped at 32.
 
     Returns
     -------
@@ -289,6 +371,10 @@ def to_icechunk(
         ``append_dim`` at the same time. To create empty arrays to fill
         in with ``region``, use the `XarrayDatasetWriter` directly.
     """
+    # validate before anything is written to the store
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+
     writer = XarrayDatasetWriter(dataset, store=store)
 
     writer._open_group(group=group, mode=mode, append_dim=append_dim, region=region)
@@ -296,6 +382,8 @@ def to_icechunk(
     # write metadata
     writer.write_metadata(encoding)
     # write in-memory arrays
-    writer.write_eager()
+    writer.write_eager(max_workers=max_workers)
     # eagerly write dask arrays
-    writer.write_lazy(chunkmanager_store_kwargs=chunkmanager_store_kwargs)
+    writer.write_lazy(
+        chunkmanager_store_kwargs=chunkmanager_store_kwargs, split_every=split_every
+    )
@@ -23,6 +23,7 @@ use icechunk::{
 use pyo3::{
     exceptions::{PyKeyError, PyValueError},
     prelude::*,
+    pybacked::PyBackedBytes,
     types::{PyNone, PyString},
 };
 use storage::{PyS3Credentials, PyStorageConfig, PyVirtualRefConfig};
@@ -464,7 +465,7 @@ impl PyIcechunkStore {
     fn async_merge<'py>(
         &self,
         py: Python<'py>,
-        change_set_bytes: Vec<u8>,
+        change_set_bytes: PyBackedBytes,
     ) -> PyResult<Bound<'py, PyAny>> {
         let store = Arc::clone(&self.store);
         pyo3_async_runtimes::tokio::future_into_py(py, async move {
@@ -472,21 +473,61 @@ impl PyIcechunkStore {
         })
     }
 
-    fn merge(&self, change_set_bytes: Vec<u8>) -> PyIcechunkStoreResult<()> {
+    fn merge(
+        &self,
+        py: Python<'_>,
+        change_set_bytes: PyBackedBytes,
+    ) -> PyIcechunkStoreResult<()> {
         let store = Arc::clone(&self.store);
 
-        pyo3_async_runtimes::tokio::get_runtime().block_on(async move {
-            do_merge(store, change_set_bytes).await?;
-            Ok(())
+        // Release the GIL while we deserialize and merge, same as `merge_many`
+        py.allow_threads(move || {
+            pyo3_async_runtimes::tokio::get_runtime().block_on(async move {
+                do_merge(store, change_set_bytes).await?;
+                Ok(())
+            })
         })
     }
 
-    fn change_set_bytes(&self) -> PyIcechunkStoreResult<Vec<u8>> {
-        let store = self.store.blocking_read();
-        let res = pyo3_async_runtimes::tokio::get_runtime()
-            .block_on(store.change_set_bytes())
-            .map_err(PyIcechunkStoreError::from)?;
-        Ok(res)
+    fn async_merge_many<'py>(
+        &self,
+        py: Python<'py>,
+        change_set_bytes: Vec<PyBackedBytes>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let store = Arc::clone(&self.store);
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            do_merge_many(store, change_set_bytes).await
+        })
+    }
+
+    fn merge_many(
+        &self,
+        py: Python<'_>,
+        change_set_bytes: Vec<PyBackedBytes>,
+    ) -> PyIcechunkStoreResult<()> {
+        let store = Arc::clone(&self.store);
+
+        // This is the reduction kernel of distributed writes, release the GIL so
+        // other tasks can keep running while we deserialize and merge
+        py.allow_threads(move || {
+            pyo3_async_runtimes::tokio::get_runtime().block_on(async move {
+                do_merge_many(store, change_set_bytes).await?;
+                Ok(())
+            })
+        })
+    }
+
+    fn change_set_bytes(&self, py: Python<'_>) -> PyIcechunkStoreResult<Vec<u8>> {
+        let store = Arc::clone(&self.store);
+
+        // Serializing a large change set takes a while, don't hold the GIL for it
+        py.allow_threads(move || {
+            let store = store.blocking_read();
+            let res = pyo3_async_runtimes::tokio::get_runtime()
+                .block_on(store.change_set_bytes())
+                .map_err(PyIcechunkStoreError::from)?;
+            Ok(res)
+        })
     }
 
     #[getter]
@@ -935,7 +976,7 @@ async fn do_checkout_tag(store: Arc<RwLock<Store>>, tag: String) -> PyResult<()>
 
 async fn do_merge(
     store: Arc<RwLock<Store>>,
-    other_change_set_bytes: Vec<u8>,
+    other_change_set_bytes: PyBackedBytes,
 ) -> PyResult<()> {
     let change_set = ChangeSet::import_from_bytes(&other_change_set_bytes)
         .map_err(PyIcechunkStoreError::from)?;
@@ -945,6 +986,21 @@ async fn do_merge(
     Ok(())
 }
 
+async fn do_merge_many(
+    store: Arc<RwLock<Store>>,
+    other_change_set_bytes: Vec<PyBackedBytes>,
+) -> PyResult<()> {
+    let change_sets = other_change_set_bytes
+        .iter()
+        .map(|bytes| ChangeSet::import_from_bytes(bytes))
+        .collect::<Result<Vec<_>, _>>()
+        .map_err(PyIcechunkStoreError::from)?;
+
+    let store = store.write().await;
+    store.merge_many(change_sets).await;
+    Ok(())
+}
+
 async fn do_reset<'py>(store: Arc<RwLock<Store>>) -> PyResult<Vec<u8>> {
     let changes =
         store.write().await.reset().await.map_err(PyIcechunkStoreError::StoreError)?;
@@ -27,3 +27,59 @@ def test_threaded():
             assert_identical(actual, ds)
         with roundtrip(ds, preserve_read_only=False) as actual:
             assert_identical(actual, ds)
+
+
+@pytest.fixture
+def merge_layers(monkeypatch):
+    """Names of the changeset merge layers built by each `stateful_store_reduce` call."""
+    import icechunk.dask
+
+    stateful_store_reduce = icechunk.dask.stateful_store_reduce
+    layers = []
+
+    def spy(stored_arrays, **kwargs):
+        graph = stateful_store_reduce(stored_arrays, **{**kwargs, "compute": False})
+        layers.extend(
+            name for name in graph.dask.layers if name.startswith("ice-changeset-merge-")
+        )
+        return stateful_store_reduce(stored_arrays, **kwargs)
+
+    monkeypatch.setattr(icechunk.dask, "stateful_store_reduce", spy)
+    return layers
+
+
+@pytest.mark.parametrize("split_every", [2, None])
+def test_split_every(split_every, merge_layers):
+    with dask.config.set(scheduler="threads"):
+        ds = create_test_data().chunk(dim1=2, dim3=5)
+        with roundtrip(ds, split_every=split_every) as actual:
+            assert_identical(actual, ds)
+    if split_every is None:
+        # few enough write tasks to merge them all in the final layer
+        assert len(merge_layers) == 1
+        assert merge_layers[0].startswith("ice-changeset-merge-final-")
+
+
+def test_split_every_default_fan_in(merge_layers):
+    import icechunk.xarray
+
+    with dask.config.set(scheduler="threads"):
+        ds = create_test_data().chunk(dim1=1, dim2=1)
+        assert (
+            sum(v.data.npartitions for v in ds.variables.values() if v.chunks)
+            > icechunk.xarray._SINGLE_MERGE_MAX_CHUNKS
+        )
+        with roundtrip(ds) as actual:
+            assert_identical(actual, ds)
+    # one intermediate level plus the final merge
+    assert len(merge_layers) == 2
+
+
+def test_chunkmanager_store_kwargs_overridden():
+    store_kwargs = {"return_stored": False, "load_stored": True, "lock": True}
+    with dask.config.set(scheduler="threads"):
+        ds = create_test_data().chunk(dim1=3, dim2=4)
+        with roundtrip(ds, chunkmanager_store_kwargs=store_kwargs) as actual:
+            assert_identical(actual, ds)
+    # the caller's kwargs are left untouched
+    assert store_kwargs == {"return_stored": False, "load_stored": True, "lock": True}
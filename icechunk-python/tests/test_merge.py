@@ -0,0 +1,35 @@
+import numpy as np
+
+import zarr
+from icechunk import IcechunkStore, StorageConfig
+
+
+def setup_writers(path: str) -> tuple[IcechunkStore, list[IcechunkStore]]:
+    storage = StorageConfig.filesystem(path)
+    store = IcechunkStore.create(storage=storage)
+    group = zarr.group(store=store, overwrite=True)
+    group.create_array("array", shape=(4,), chunk_shape=(2,), dtype="i4")
+    store.commit("create array")
+
+    # two other writers, each writing a different chunk
+    writers = [IcechunkStore.open_existing(storage=storage) for _ in range(2)]
+    for i, writer in enumerate(writers):
+        array = zarr.open_array(store=writer, path="array")
+        array[2 * i : 2 * i + 2] = i + 1
+    return store, writers
+
+
+def test_merge_many(tmpdir):
+    store, writers = setup_writers(str(tmpdir))
+    store.merge_many(writer.change_set_bytes() for writer in writers)
+
+    array = zarr.open_array(store=store, path="array")
+    np.testing.assert_array_equal(array[:], [1, 1, 2, 2])
+
+
+async def test_async_merge_many(tmpdir):
+    store, writers = setup_writers(str(tmpdir))
+    await store.async_merge_many([writer.change_set_bytes() for writer in writers])
+
+    array = zarr.open_array(store=store, path="array")
+    np.testing.assert_array_equal(array[:], [1, 1, 2, 2])
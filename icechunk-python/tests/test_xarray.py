@@ -5,13 +5,16 @@ pytest.importorskip("xarray")
 import contextlib
 import string
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
 
+import icechunk.xarray
 import xarray as xr
+import zarr
 from icechunk import IcechunkStore, StorageConfig
-from icechunk.xarray import to_icechunk
+from icechunk.xarray import _is_all_fill_value, to_icechunk
 from xarray.testing import assert_identical
 
 
@@ -48,14 +51,14 @@ def create_test_data(
 
 
 @contextlib.contextmanager
-def roundtrip(data: xr.Dataset, preserve_read_only: bool = False) -> xr.Dataset:
+def roundtrip(data: xr.Dataset, preserve_read_only: bool = False, **kwargs) -> xr.Dataset:
     with tempfile.TemporaryDirectory() as tmpdir:
         store = IcechunkStore.create(StorageConfig.filesystem(tmpdir))
         if preserve_read_only:
             with store.preserve_read_only():
-                to_icechunk(data, store=store, mode="w")
+                to_icechunk(data, store=store, mode="w", **kwargs)
         else:
-            to_icechunk(data, store=store, mode="w")
+            to_icechunk(data, store=store, mode="w", **kwargs)
         with xr.open_zarr(store, consolidated=False) as ds:
             yield ds
 
@@ -64,3 +67,100 @@ def test_xarray_to_icechunk():
     ds = create_test_data()
     with roundtrip(ds) as actual:
         assert_identical(actual, ds)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, None])
+def test_xarray_to_icechunk_max_workers(monkeypatch, max_workers):
+    pools = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def __init__(self, max_workers=None, **kwargs):
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(icechunk.xarray, "ThreadPoolExecutor", RecordingExecutor)
+    ds = create_test_data()
+    with roundtrip(ds, max_workers=max_workers) as actual:
+        assert_identical(actual, ds)
+    # all in-memory variables are written through a single pool
+    assert pools == [max_workers or min(32, len(ds.variables))]
+
+
+def test_xarray_to_icechunk_fill_value_variables(monkeypatch):
+    written = []
+    setitem = zarr.Array.__setitem__
+
+    def spy(self, selection, value):
+        written.append(self.basename)
+        return setitem(self, selection, value)
+
+    monkeypatch.setattr(zarr.Array, "__setitem__", spy)
+
+    ds = create_test_data()
+    ds["empty"] = (("dim1", "dim2"), np.full((8, 9), np.nan))
+    ds["zeros"] = (("dim1", "dim2"), np.zeros((8, 9), dtype="int32"))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = IcechunkStore.create(StorageConfig.filesystem(tmpdir))
+        to_icechunk(ds, store=store, mode="w")
+        # freshly created arrays skip the writes that are all fill value
+        assert "var1" in written
+        assert "empty" not in written
+        assert "zeros" not in written
+        with xr.open_zarr(store, consolidated=False) as actual:
+            assert_identical(actual, ds)
+
+        # existing arrays may hold other values, so those writes must go through
+        written.clear()
+        to_icechunk(ds, store=store, mode="a")
+        assert "empty" in written
+        assert "zeros" in written
+        with xr.open_zarr(store, consolidated=False) as actual:
+            assert_identical(actual, ds)
+
+
+@pytest.mark.parametrize("size", [10, 100_000])
+def test_is_all_fill_value(size):
+    data = np.zeros((2, size), dtype="int32")
+    assert _is_all_fill_value(data, 0)
+    data[-1, -1] = 1
+    assert not _is_all_fill_value(data, 0)
+    assert _is_all_fill_value(np.full(size, np.nan), np.nan)
+    assert not _is_all_fill_value(np.arange(size, dtype="float64"), np.nan)
+
+
+def test_xarray_region_auto_writes():
+    ds = create_test_data().assign_coords(dim1=np.arange(8))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = IcechunkStore.create(StorageConfig.filesystem(tmpdir))
+        to_icechunk(ds, store=store, mode="w")
+
+        expected = ds.copy()
+        expected["var1"] = expected.var1 * 2
+        update = expected.drop_vars(
+            [name for name, var in expected.variables.items() if "dim1" not in var.dims]
+        )
+        for start in [0, 2, 4, 6]:
+            subset = update.isel(dim1=slice(start, start + 2))
+            to_icechunk(subset, store=store, region={"dim1": "auto"})
+
+        with xr.open_zarr(store, consolidated=False) as actual:
+            assert_identical(actual, expected)
+
+        # the region is detected from the indexes currently in the store
+        shifted = ds.assign_coords(dim1=np.arange(-2, 6))
+        to_icechunk(shifted, store=store, mode="w")
+        to_icechunk(update.isel(dim1=slice(0, 2)), store=store, region={"dim1": "auto"})
+
+        shifted["var1"][2:4] = update.var1[0:2].values
+        with xr.open_zarr(store, consolidated=False) as actual:
+            assert_identical(actual, shifted)
+
+
+def test_xarray_to_icechunk_invalid_max_workers():
+    ds = create_test_data()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = IcechunkStore.create(StorageConfig.filesystem(tmpdir))
+        with pytest.raises(ValueError, match="max_workers"):
+            to_icechunk(ds, store=store, mode="w", max_workers=0)
+        # rejected before any metadata is written
+        assert not store.has_uncommitted_changes
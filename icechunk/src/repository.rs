@@ -654,6 +654,11 @@ impl Repository {
         self.change_set.merge(changes);
     }
 
+    /// Merge several `ChangeSet`s into the repository without committing them
+    pub async fn merge_many<T: IntoIterator<Item = ChangeSet>>(&mut self, changes: T) {
+        self.change_set.merge_many(changes);
+    }
+
     /// After changes to the repository have been made, this generates and writes to `Storage` the updated datastructures.
     ///
     /// After calling this, changes are reset and the [`Repository`] can continue to be used for further
@@ -504,6 +504,11 @@ impl Store {
         self.repository.write().await.merge(changes).await;
     }
 
+    /// Merge several change sets, taking the repository lock only once
+    pub async fn merge_many<T: IntoIterator<Item = ChangeSet>>(&self, changes: T) {
+        self.repository.write().await.merge_many(changes).await;
+    }
+
     /// Commit the current changes to the current branch. If the store is not currently
     /// on a branch, this will return an error.
     pub async fn commit(&self, message: &str) -> StoreResult<SnapshotId> {
@@ -1958,6 +1963,50 @@ mod tests {
         Ok(())
     }
 
+    #[tokio::test]
+    async fn test_merge_many() -> Result<(), Box<dyn std::error::Error>> {
+        let storage: Arc<dyn Storage + Send + Sync> =
+            Arc::new(ObjectStorage::new_in_memory_store(Some("prefix".into())));
+        let ds = Repository::init(Arc::clone(&storage), false).await?.build();
+        let store = Store::from_repository(
+            ds,
+            AccessMode::ReadWrite,
+            Some("main".to_string()),
+            None,
+        );
+
+        store
+            .set(
+                "zarr.json",
+                Bytes::copy_from_slice(br#"{"zarr_format":3, "node_type":"group"}"#),
+            )
+            .await?;
+        let zarr_meta = Bytes::copy_from_slice(br#"{"zarr_format":3,"node_type":"array","attributes":{"foo":42},"shape":[2,2,2],"data_type":"int32","chunk_grid":{"name":"regular","configuration":{"chunk_shape":[1,1,1]}},"chunk_key_encoding":{"name":"default","configuration":{"separator":"/"}},"fill_value":0,"codecs":[{"name":"mycodec","configuration":{"foo":42}}],"storage_transformers":[{"name":"mytransformer","configuration":{"bar":43}}],"dimension_names":["x","y","t"]}"#);
+        store.set("array/zarr.json", zarr_meta).await?;
+        let oid = store.commit("create array").await?;
+
+        // two other writers, each setting a different chunk
+        let keys = ["array/c/0/0/0", "array/c/1/1/1"];
+        let mut change_sets = Vec::new();
+        for key in keys {
+            let ds = Repository::update(Arc::clone(&storage), oid.clone()).build();
+            let writer = Store::from_repository(ds, AccessMode::ReadWrite, None, None);
+            writer.set(key, Bytes::copy_from_slice(key.as_bytes())).await?;
+            change_sets
+                .push(ChangeSet::import_from_bytes(&writer.change_set_bytes().await?)?);
+        }
+
+        store.merge_many(change_sets).await;
+        for key in keys {
+            assert_eq!(
+                store.get(key, &ByteRange::ALL).await?,
+                Bytes::copy_from_slice(key.as_bytes())
+            );
+        }
+
+        Ok(())
+    }
+
     #[tokio::test]
     async fn test_metadata_list() -> Result<(), Box<dyn std::error::Error>> {
         let storage: Arc<dyn Storage + Send + Sync> =